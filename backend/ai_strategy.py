@@ -22,9 +22,12 @@ logger = logging.getLogger(__name__)
 # ── Action labels per spec ─────────────────────────────────────────────────────
 ACTIONS = ["Conserve", "Trade", "Expand", "Conflict"]
 
+# Observation keys for the nation's own four resources
+_OWN_KEYS = ("own_water", "own_food", "own_energy", "own_land")
+
 # ── Shared helper ─────────────────────────────────────────────────────────────
 
-def _avg(obs: Dict[str, float], keys: list[str]) -> float:
+def _avg(obs: Dict[str, float], keys: tuple[str, ...]) -> float:
     vals = [obs.get(k, 0.5) for k in keys]
     return sum(vals) / max(len(vals), 1)
 
@@ -48,12 +51,16 @@ def _weighted_choice(weights: Dict[str, float]) -> str:
 class PresidentStrategy:
     """Abstract base for all 5 nation presidents."""
 
+    __slots__ = ("_history", "_tick", "_phase")
+
     name: str = "President"
     region_id: str = "UNKNOWN"
 
     def __init__(self) -> None:
         self._history: Deque[str] = deque(maxlen=8)
         self._tick = 0
+        # Per-president phase offset for _oscillate(); region_id never changes
+        self._phase = hash(self.region_id) % 100
 
     def get_action(self, obs: Dict[str, Any], tick: int) -> str:
         self._tick = tick
@@ -67,17 +74,12 @@ class PresidentStrategy:
     # ── shared helpers ────────────────────────────────────────────────────────
 
     def _own_avg(self, obs: Dict[str, Any]) -> float:
-        return _avg(obs, ["own_water", "own_food", "own_energy", "own_land"])
+        return _avg(obs, _OWN_KEYS)
 
     def _min_resource(self, obs: Dict[str, Any]) -> tuple[str, float]:
-        r = {
-            "own_water": obs.get("own_water", 0.5),
-            "own_food":  obs.get("own_food",  0.5),
-            "own_energy":obs.get("own_energy",0.5),
-            "own_land":  obs.get("own_land",  0.5),
-        }
-        key = min(r, key=lambda k: r[k])
-        return key, r[key]
+        vals = [obs.get(k, 0.5) for k in _OWN_KEYS]
+        i = min(range(len(vals)), key=vals.__getitem__)
+        return _OWN_KEYS[i], vals[i]
 
     def _last_n(self, action: str, n: int = 3) -> int:
         """Count how many of the last n actions match."""
@@ -90,7 +92,7 @@ class PresidentStrategy:
 
     def _oscillate(self) -> float:
         """Slow sinusoidal personality oscillation (0..1). Makes decisions drift."""
-        return 0.5 + 0.5 * math.sin(self._tick * 0.07 + hash(self.region_id) % 100)
+        return 0.5 + 0.5 * math.sin(self._tick * 0.07 + self._phase)
 
 
 # ── Aquilonia — The Fortress ───────────────────────────────────────────────────
@@ -101,6 +103,8 @@ class AquiloniaStrategy(PresidentStrategy):
     Prefers Conserve when well-stocked; escalates to Conflict when threatened.
     Occasionally trades from surplus but never willingly expands.
     """
+    __slots__ = ()
+
     name = "President Aldric"
     region_id = "AQUILONIA"
 
@@ -150,6 +154,8 @@ class VerdantisStrategy(PresidentStrategy):
     Food-rich balanced nation. Reward focus: Balance across all 4 resources.
     Trades to fill gaps, conserves when balanced, rarely conflicts.
     """
+    __slots__ = ()
+
     name = "President Sylvara"
     region_id = "VERDANTIS"
 
@@ -201,6 +207,8 @@ class IgnisStrategy(PresidentStrategy):
     Energy-rich expansionist. Reward focus: Maximum energy use & population growth.
     Prefers Expand aggressively; burns energy fast; Conflicts when blocked.
     """
+    __slots__ = ()
+
     name = "President Ignar"
     region_id = "IGNIS_CORE"
 
@@ -257,6 +265,8 @@ class TerranovaStrategy(PresidentStrategy):
     Will Trade when weak to build trust, then Conflict to drain neighbours.
     Has a cycle: Trade → build relations → Conflict → steal → repeat.
     """
+    __slots__ = ("_patience",)
+
     name = "President Vorn"
     region_id = "TERRANOVA"
 
@@ -315,6 +325,8 @@ class NexusStrategy(PresidentStrategy):
     Monitors average prosperity of ALL regions. Intervenes through Trade
     to stabilise the world. Avoids Conflict almost entirely.
     """
+    __slots__ = ()
+
     name = "President Aura"
     region_id = "THE_NEXUS"
 
@@ -355,15 +367,17 @@ class NexusStrategy(PresidentStrategy):
 
 # ── Factory ───────────────────────────────────────────────────────────────────
 
+_STRATEGIES: Dict[str, type[PresidentStrategy]] = {
+    "AQUILONIA":  AquiloniaStrategy,
+    "VERDANTIS":  VerdantisStrategy,
+    "IGNIS_CORE": IgnisStrategy,
+    "TERRANOVA":  TerranovaStrategy,
+    "THE_NEXUS":  NexusStrategy,
+}
+
+
 def make_strategy(region_id: str) -> PresidentStrategy:
-    mapping = {
-        "AQUILONIA":  AquiloniaStrategy,
-        "VERDANTIS":  VerdantisStrategy,
-        "IGNIS_CORE": IgnisStrategy,
-        "TERRANOVA":  TerranovaStrategy,
-        "THE_NEXUS":  NexusStrategy,
-    }
-    cls = mapping.get(region_id, NexusStrategy)
+    cls = _STRATEGIES.get(region_id, NexusStrategy)
     strat = cls()
     logger.info("Created strategy %s for region %s", cls.__name__, region_id)
     return strat
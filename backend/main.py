@@ -8,16 +8,17 @@ Endpoint: /ws/world-state  (also aliased as /ws for backward compat)
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from contextlib import asynccontextmanager
-from typing import Set
+from typing import Set, Tuple
 
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
-from simulation import start_simulation, stop_simulation, pause_simulation, resume_simulation
+from simulation import (
+    start_simulation, stop_simulation, pause_simulation, resume_simulation, set_has_clients,
+)
 
 # ──────────────────────────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -26,8 +27,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("worldsim.main")
 
-_state_queue: asyncio.Queue = asyncio.Queue(maxsize=50)
+_state_queue: asyncio.Queue = asyncio.Queue(maxsize=1)   # latest snapshot wins
 _clients: Set[WebSocket] = set()
+_client_snapshot: Tuple[WebSocket, ...] = ()   # rebuilt only when _clients changes
 _is_running: bool = True
 
 
@@ -35,19 +37,29 @@ _is_running: bool = True
 # Broadcaster
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _clients_changed() -> None:
+    """Refresh the broadcast snapshot and the sim thread's has-clients flag."""
+    global _client_snapshot
+    _client_snapshot = tuple(_clients)
+    set_has_clients(bool(_client_snapshot))
+
+
 async def broadcaster() -> None:
     while True:
-        state = await _state_queue.get()
-        if not _clients:
+        payload = await _state_queue.get()   # JSON text, encoded by the sim thread
+        targets = _client_snapshot
+        if not targets:
             continue
-        payload = json.dumps(state)
-        dead: Set[WebSocket] = set()
-        for ws in list(_clients):
-            try:
-                await ws.send_text(payload)
-            except Exception:
-                dead.add(ws)
-        _clients.difference_update(dead)
+        # Send concurrently so one slow client doesn't hold up the rest
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in targets), return_exceptions=True
+        )
+        dead: Set[WebSocket] = {
+            ws for ws, res in zip(targets, results) if isinstance(res, Exception)
+        }
+        if dead:
+            _clients.difference_update(dead)
+            _clients_changed()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -87,17 +99,21 @@ app.add_middleware(
 async def _handle_ws(websocket: WebSocket) -> None:
     await websocket.accept()
     _clients.add(websocket)
+    _clients_changed()
     client = websocket.client
     logger.info("Client connected: %s  (total: %d)", client, len(_clients))
     try:
+        # Inbound frames are ignored, so read raw ASGI messages rather than
+        # paying for receive_text()'s decode/validation on every frame.
         while True:
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        pass
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except Exception as e:
         logger.warning("WS error: %s", e)
     finally:
         _clients.discard(websocket)
+        _clients_changed()
         logger.info("Client disconnected. (remaining: %d)", len(_clients))
 
 
@@ -126,19 +142,30 @@ async def status() -> dict:
     return {"running": _is_running}
 
 
+def _control_stop() -> dict:
+    global _is_running
+    _is_running = False
+    pause_simulation()
+    return {"running": False}
+
+
+def _control_start() -> dict:
+    global _is_running
+    _is_running = True
+    resume_simulation()
+    return {"running": True}
+
+
+_CONTROL_ACTIONS = {"stop": _control_stop, "start": _control_start}
+
+
 @app.post("/control")
 async def control(body: dict) -> dict:
-    global _is_running
     action = body.get("action", "")
-    if action == "stop":
-        _is_running = False
-        pause_simulation()
-        return {"running": False}
-    elif action == "start":
-        _is_running = True
-        resume_simulation()
-        return {"running": True}
-    return {"error": "Unknown action"}
+    handler = _CONTROL_ACTIONS.get(action)
+    if handler is None:
+        return {"error": "Unknown action"}
+    return handler()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -23,14 +23,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import math
 import random
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import mesa
 import numpy as np
+import orjson
 
 from ai_strategy import make_strategy, PresidentStrategy
 
@@ -107,14 +107,26 @@ NATION_PROFILES: List[Dict[str, Any]] = [
 # Climate Engine
 # ──────────────────────────────────────────────────────────────────────────────
 
-CLIMATE_TYPES = ["Drought", "SolarFlare", "Blight", None]
+# Per-tick resource delta of each climate event: (resource, delta)
+_CLIMATE_EFFECTS: Dict[str, Tuple[str, float]] = {
+    "Drought":    ("water",  -0.025),
+    "SolarFlare": ("energy", +0.018),
+    "Blight":     ("food",   -0.022),
+}
+_CLIMATE_EVENTS = tuple(_CLIMATE_EFFECTS)
+# Severity each event contributes to a nation's observation (0.0 when calm)
+_WEATHER_SEVERITY: Dict[str, float] = {"Drought": 0.75, "SolarFlare": 0.85, "Blight": 0.80}
 
 class ClimateEngine:
     """Periodically fires climate events that affect all regions."""
 
+    __slots__ = ("event_type", "duration", "effect", "_next_event_in")
+
     def __init__(self) -> None:
         self.event_type: Optional[str] = None
         self.duration: int = 0
+        # Resolved once per event so each nation's update needs no branching
+        self.effect: Optional[Tuple[str, float]] = None
         self._next_event_in: int = random.randint(35, 60)
 
     def tick(self, tick: int) -> None:
@@ -123,6 +135,7 @@ class ClimateEngine:
             if self.duration == 0:
                 logger.info("Climate event %s ended at tick %d", self.event_type, tick)
                 self.event_type = None
+                self.effect     = None
         else:
             self._next_event_in -= 1
             if self._next_event_in <= 0:
@@ -130,20 +143,17 @@ class ClimateEngine:
                 self._next_event_in = random.randint(40, 70)
 
     def _trigger(self, tick: int) -> None:
-        self.event_type = random.choice(["Drought", "SolarFlare", "Blight"])
+        self.event_type = random.choice(_CLIMATE_EVENTS)
         self.duration   = random.randint(6, 14)
+        self.effect     = _CLIMATE_EFFECTS[self.event_type]
         logger.info("Climate event %s started at tick %d for %d ticks",
                     self.event_type, tick, self.duration)
 
-    def apply_to_resources(self, resources: Dict[str, float]) -> Dict[str, float]:
-        r = dict(resources)
-        if self.event_type == "Drought":
-            r["water"] = max(0.0, r["water"] - 0.025)
-        elif self.event_type == "SolarFlare":
-            r["energy"] = min(1.0, r["energy"] + 0.018)
-        elif self.event_type == "Blight":
-            r["food"] = max(0.0, r["food"] - 0.022)
-        return r
+    def apply_to_resources(self, r: Dict[str, float]) -> None:
+        """Apply the active event's modifier to *r* in place."""
+        if self.effect is not None:
+            k, delta = self.effect
+            r[k] = min(1.0, max(0.0, r[k] + delta))
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -158,6 +168,8 @@ class ClimateEngine:
 
 # Natural decay rates per resource per tick (at 2 Hz → ~0.5 s/tick)
 _BASE_DECAY = {"water": 0.0038, "food": 0.0045, "energy": 0.0060, "land": 0.0010}
+_DECAY_KEYS  = tuple(_BASE_DECAY)
+_DECAY_BASE  = np.array([_BASE_DECAY[k] for k in _DECAY_KEYS])
 
 class NationAgent(mesa.Agent):
     """Represents one of the 5 sovereign nations."""
@@ -184,26 +196,37 @@ class NationAgent(mesa.Agent):
 
         # Base crime attractor from profile (mean-reversion target)
         self._crime_attractor: float = profile["crime_rate"]
-        # Smooth resource memory for trend calculation
-        self._prev_resources: Dict[str, float] = dict(self.resources)
+        # Filled in by WorldModel once every nation exists
+        self.index:       int = 0            # row in the model's per-tick arrays
+        self.neighbours:  List["NationAgent"] = []
+        self.tribe_mates: List["NationAgent"] = []
+        # Identity fields never change — build them once for to_dict()
+        self._static_fields: Dict[str, Any] = {
+            "id":          self.nation_id,
+            "name":        self.name,
+            "title":       self.title,
+            "color_hint":  self.color_hint,
+            "tribe":       self.tribe,
+            "position":    self.position,
+        }
 
     # ------------------------------------------------------------------
     # Observation
     # ------------------------------------------------------------------
 
-    def _build_obs(self, neighbours: List["NationAgent"],
-                   climate: ClimateEngine, all_agents: List["NationAgent"]) -> Dict[str, Any]:
-        nb_avg = (
-            sum(sum(n.resources.values()) / 4 for n in neighbours) / max(len(neighbours), 1)
-        )
-        global_avg = (
-            sum(sum(a.resources.values()) / 4 for a in all_agents) / max(len(all_agents), 1)
-        )
-        global_crime = sum(a.crime_rate for a in all_agents) / max(len(all_agents), 1)
-        weather_state = 0.0
-        if climate.event_type == "Drought":   weather_state = 0.75
-        elif climate.event_type == "SolarFlare": weather_state = 0.85
-        elif climate.event_type == "Blight":  weather_state = 0.80
+    def _build_obs(self, climate: ClimateEngine,
+                   all_agents: List["NationAgent"]) -> Dict[str, Any]:
+        # Single walk over all nations (self included); the neighbour total
+        # is the global total minus our own contribution.
+        total_avg = total_crime = 0.0
+        for a in all_agents:
+            total_avg   += sum(a.resources.values()) / 4
+            total_crime += a.crime_rate
+        own_avg      = sum(self.resources.values()) / 4
+        nb_avg       = (total_avg - own_avg) / max(len(all_agents) - 1, 1)
+        global_avg   = total_avg / max(len(all_agents), 1)
+        global_crime = total_crime / max(len(all_agents), 1)
+        weather_state = _WEATHER_SEVERITY.get(climate.event_type, 0.0)
 
         return {
             "own_water":           self.resources["water"],
@@ -222,14 +245,13 @@ class NationAgent(mesa.Agent):
     # ------------------------------------------------------------------
 
     def step(self) -> None:
-        all_agents: List[NationAgent] = list(self.model.agents)
-        neighbours: List[NationAgent] = [a for a in all_agents if a is not self]
+        all_agents: List[NationAgent] = self.model.nations
 
         self._apply_decay(self.model.climate)
-        obs    = self._build_obs(neighbours, self.model.climate, all_agents)
+        obs    = self._build_obs(self.model.climate, all_agents)
         action = self.strategy.get_action(obs, self.model.tick)
         self.last_action = action
-        self._apply_action(action, neighbours)
+        self._apply_action(action)
         self._apply_energy_entropy()
         self._clamp()
 
@@ -238,32 +260,27 @@ class NationAgent(mesa.Agent):
     # ------------------------------------------------------------------
 
     def _apply_decay(self, climate: ClimateEngine) -> None:
-        # Natural resource depletion with micro-noise
-        for k, base in _BASE_DECAY.items():
-            noise = np.random.uniform(-0.002, 0.002)
-            self.resources[k] -= float(base + noise)
+        # Natural resource depletion with micro-noise (drawn per tick by the model)
+        decay = _DECAY_BASE + self.model.decay_noise[self.index]
+        for k, d in zip(_DECAY_KEYS, decay.tolist()):
+            self.resources[k] -= d
 
         # Climate modifier
-        self.resources = climate.apply_to_resources(self.resources)
+        climate.apply_to_resources(self.resources)
 
         # Crime mean-reversion + random walk
         drift = 0.008 * (self._crime_attractor - self.crime_rate)
         shock = random.gauss(0, 0.012)
-        self.crime_rate = float(np.clip(self.crime_rate + drift + shock, 0.0, 1.0))
+        self.crime_rate = min(1.0, max(0.0, self.crime_rate + drift + shock))
 
     # ------------------------------------------------------------------
     # Action effects
     # ------------------------------------------------------------------
 
-    def _apply_action(self, action: str, neighbours: List["NationAgent"]) -> None:
-        if action == "Conserve":
-            self._do_conserve()
-        elif action == "Trade":
-            self._do_trade(neighbours)
-        elif action == "Expand":
-            self._do_expand()
-        elif action == "Conflict":
-            self._do_conflict(neighbours)
+    def _apply_action(self, action: str) -> None:
+        handler = _ACTION_HANDLERS.get(action)
+        if handler is not None:
+            handler(self)
 
     def _do_conserve(self) -> None:
         """Save resources — small bonus across the board."""
@@ -272,23 +289,24 @@ class NationAgent(mesa.Agent):
             self.resources[k] += bonus * random.uniform(0.5, 1.5)
         self.crime_rate -= random.uniform(0.005, 0.015)
 
-    def _do_trade(self, neighbours: List["NationAgent"]) -> None:
+    def _do_trade(self) -> None:
         """Trade scarce resource for abundant neighbour surplus.
         Tribe bonus: same-tribe trade costs 15% less energy.
         """
+        neighbours = self.neighbours
         if not neighbours:
             return
         # Pick partner (prefer tribe-mate for discount)
-        tribe_mates = [n for n in neighbours if n.tribe == self.tribe]
+        tribe_mates = self.tribe_mates
         partner: NationAgent = (
             random.choice(tribe_mates) if tribe_mates and random.random() < 0.6
             else random.choice(neighbours)
         )
 
         # Determine scarce/abundant resources BEFORE any modifications
-        own_min_k  = min(self.resources, key=lambda k: self.resources[k])
-        own_max_k  = max(self.resources, key=lambda k: self.resources[k])
-        part_max_k = max(partner.resources, key=lambda k: partner.resources[k])
+        own_min_k  = min(self.resources, key=self.resources.__getitem__)
+        own_max_k  = max(self.resources, key=self.resources.__getitem__)
+        part_max_k = max(partner.resources, key=partner.resources.__getitem__)
 
         # 15% reduction in energy trade cost for matching tribes
         energy_cost = 0.05
@@ -319,19 +337,17 @@ class NationAgent(mesa.Agent):
         self.resources["food"]   -= random.uniform(0.015, 0.03)
         self.crime_rate          += random.uniform(0.003, 0.012)
 
-    def _do_conflict(self, neighbours: List["NationAgent"]) -> None:
+    def _do_conflict(self) -> None:
         """Attempt to steal a resource chunk from a weaker neighbour."""
+        neighbours = self.neighbours
         if not neighbours:
             return
         # Target the weakest/richest as appropriate
-        target: NationAgent = min(
-            neighbours,
-            key=lambda n: n.resources.get("energy", 0.5) + n.crime_rate * 0.5
-        )
+        target: NationAgent = min(neighbours, key=_conflict_target_score)
         # Steal success chance depends on our crime rate (aggression capacity)
         success_prob = 0.45 + self.crime_rate * 0.35
         if random.random() < success_prob:
-            stolen_k = max(target.resources, key=lambda k: target.resources[k])
+            stolen_k = max(target.resources, key=target.resources.__getitem__)
             steal_amt = random.uniform(0.04, 0.12)
             target.resources[stolen_k] = max(0.0, target.resources[stolen_k] - steal_amt)
             self.resources[stolen_k]   = min(1.0, self.resources[stolen_k]   + steal_amt * 0.8)
@@ -355,27 +371,45 @@ class NationAgent(mesa.Agent):
 
     # ------------------------------------------------------------------
     def _clamp(self) -> None:
-        for k in self.resources:
-            self.resources[k] = float(np.clip(self.resources[k], 0.0, 1.0))
-        self.crime_rate = float(np.clip(self.crime_rate, 0.0, 1.0))
+        # Plain min/max: np.clip on a scalar costs a ufunc dispatch + 0-d array
+        res = self.resources
+        for k, v in res.items():
+            res[k] = min(1.0, max(0.0, v))
+        self.crime_rate = min(1.0, max(0.0, self.crime_rate))
         self.population = max(100_000, self.population)
 
     # ------------------------------------------------------------------
     def to_dict(self) -> Dict[str, Any]:
+        res = self.resources
         return {
-            "id":          self.nation_id,
-            "name":        self.name,
-            "title":       self.title,
-            "color_hint":  self.color_hint,
-            "tribe":       self.tribe,
-            "position":    self.position,
-            "resources":   {k: round(v, 4) for k, v in self.resources.items()},
+            **self._static_fields,
+            # Literal over the four fixed keys; avoids a comprehension frame per call
+            "resources":   {
+                "water":  round(res["water"],  4),
+                "food":   round(res["food"],   4),
+                "energy": round(res["energy"], 4),
+                "land":   round(res["land"],   4),
+            },
             "crime_rate":  round(self.crime_rate, 4),
             "population":  self.population,
             "last_action": self.last_action,
         }
 
 
+def _conflict_target_score(n: NationAgent) -> float:
+    """Lower is a softer target: little energy and low unrest."""
+    return n.resources.get("energy", 0.5) + n.crime_rate * 0.5
+
+
+# Action name → effect, looked up once per step instead of an if/elif chain
+_ACTION_HANDLERS: Dict[str, Callable[[NationAgent], None]] = {
+    "Conserve": NationAgent._do_conserve,
+    "Trade":    NationAgent._do_trade,
+    "Expand":   NationAgent._do_expand,
+    "Conflict": NationAgent._do_conflict,
+}
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # WorldModel
 # ──────────────────────────────────────────────────────────────────────────────
@@ -392,12 +426,29 @@ class WorldModel(mesa.Model):
             strategy = make_strategy(profile["id"])
             NationAgent(self, profile, strategy)   # auto-registered to self.agents
 
+        # The nation set is fixed for the model's lifetime, so resolve the
+        # agent list and each nation's neighbours once instead of per step.
+        self.nations: List[NationAgent] = list(self.agents)
+        for i, nation in enumerate(self.nations):
+            nation.index       = i
+            nation.neighbours  = [n for n in self.nations if n is not nation]
+            nation.tribe_mates = [n for n in nation.neighbours if n.tribe == nation.tribe]
+
+        self.decay_noise = np.zeros((len(self.nations), len(_DECAY_KEYS)))
+        # Activation order, reshuffled in place each tick
+        self._order: List[NationAgent] = list(self.nations)
+
         logger.info("WorldModel initialised with %d sovereign nations.", len(list(self.agents)))
 
     def step(self) -> None:
         self.climate.tick(self.tick)
-        # Mesa 3.x: shuffle_do gives random activation order each tick
-        self.agents.shuffle_do("step")
+        # One draw covers every nation's decay noise for this tick
+        self.decay_noise = self.rng.uniform(-0.002, 0.002, self.decay_noise.shape)
+        # Random activation order each tick, as AgentSet.shuffle_do would give,
+        # without its per-tick weakref list copy and getattr dispatch
+        self.random.shuffle(self._order)
+        for nation in self._order:
+            nation.step()
         self.tick += 1
         if self.tick % 20 == 0:
             logger.info("Tick %d — climate: %s", self.tick, self.climate.event_type)
@@ -418,12 +469,24 @@ _sim_thread: Optional[threading.Thread] = None
 _stop_event  = threading.Event()
 _pause_event = threading.Event()
 _pause_event.set()   # unpaused by default
+_has_clients = threading.Event()   # set while at least one viewer is connected
+
+
+def _put_latest(queue: asyncio.Queue, item: Any) -> None:
+    """Event-loop side of the hand-off: keep only the newest snapshot."""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        queue.get_nowait()   # drop the stale frame nobody has sent yet
+        queue.put_nowait(item)
 
 
 def run_simulation(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
     """
-    Background thread: ticks WorldModel at ~2 Hz and pushes JSON
-    state dicts onto the asyncio queue owned by the main event loop.
+    Background thread: ticks WorldModel at ~2 Hz and pushes the state,
+    already serialised to JSON text, onto the asyncio queue owned by the
+    main event loop. Encoding here keeps it off the event loop and means
+    every client is sent the same pre-built frame.
     """
     model = WorldModel()
     logger.info("Simulation thread started.")
@@ -433,10 +496,13 @@ def run_simulation(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> Non
             break
         t0 = time.perf_counter()
         model.step()
-        state = model.get_state()
-        asyncio.run_coroutine_threadsafe(queue.put(state), loop)
+        if _has_clients.is_set():
+            # orjson output is already compact; decode to str for text frames
+            payload = orjson.dumps(model.get_state()).decode()
+            loop.call_soon_threadsafe(_put_latest, queue, payload)
         elapsed = time.perf_counter() - t0
-        time.sleep(max(0.0, 0.5 - elapsed))
+        # Waiting on the stop event (not sleeping) lets shutdown interrupt the tick gap
+        _stop_event.wait(max(0.0, 0.5 - elapsed))
     logger.info("Simulation thread stopped.")
 
 
@@ -451,6 +517,16 @@ def start_simulation(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> N
 
 def stop_simulation() -> None:
     _stop_event.set()
+    _pause_event.set()   # wake a paused thread so it can observe the stop
+
+
+def set_has_clients(active: bool) -> None:
+    """Tell the sim thread whether anyone is watching; if not, it skips
+    building and encoding snapshots (the model keeps ticking)."""
+    if active:
+        _has_clients.set()
+    else:
+        _has_clients.clear()
 
 
 def pause_simulation() -> None: